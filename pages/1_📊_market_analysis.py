@@ -2,21 +2,29 @@
 from __future__ import annotations
 
 import asyncio
+import html
+import os
 import sys
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:  # הסקריפט רץ מחדש בכל rerun — בלי כפילויות ב-sys.path
+    sys.path.insert(0, _ROOT)
 
-import nest_asyncio
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
-from src.market.orchestrator import run_market_analysis
-from src.market.pdf_report import generate_pdf
+if TYPE_CHECKING:
+    import pandas as pd
 
-nest_asyncio.apply()
+# plotly ו-pandas מיובאים בתוך הפונקציות שמשתמשות בהם:
+# מסך הפתיחה והסרגל לא צריכים אותם, והטעינה הראשונה של plotly איטית.
+from src.market.orchestrator import run_market_analysis
+from src.ui.pdf import pdf_download, report_key
+from src.ui.shell import style_tag
 
 st.set_page_config(
     page_title="ניתוח שוק | Real Capital",
@@ -26,8 +34,7 @@ st.set_page_config(
 )
 
 # ─── CSS ─────────────────────────────────────────────────────────────────────
-st.markdown("""
-<style>
+_CSS_MARKET = """
 @import url('https://fonts.googleapis.com/css2?family=Heebo:wght@300;400;500;600;700;800;900&display=swap');
 
 /* ── בסיס ─────────────────────────────────────────────────── */
@@ -218,6 +225,8 @@ html, body, [data-testid="stAppViewContainer"] {
 .kpi-label { color: #7B8FA3; font-size: 0.78rem; font-weight: 600; margin-bottom: 0.4rem; letter-spacing: 0.3px; text-transform: uppercase; }
 .kpi-value { color: #0B1F3B; font-size: 1.65rem; font-weight: 800; line-height: 1.1; }
 .kpi-sub   { color: #4A90D9; font-size: 0.75rem; margin-top: 0.3rem; font-weight: 500; }
+.kpi-grid  { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; margin-bottom: 1rem; direction: rtl; }
+@media (max-width: 640px) { .kpi-grid { grid-template-columns: 1fr; } }
 
 /* ── כותרת דוח ───────────────────────────────────────────── */
 .report-header {
@@ -344,6 +353,8 @@ html, body, [data-testid="stAppViewContainer"] {
 .welcome-card-icon { font-size: 2.2rem; margin-bottom: 0.75rem; }
 .welcome-card-title { color: #0B1F3B; font-weight: 700; font-size: 1rem; margin-bottom: 0.3rem; }
 .welcome-card-sub { color: #7B8FA3; font-size: 0.82rem; line-height: 1.5; }
+.welcome-grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; direction: rtl; }
+@media (max-width: 640px) { .welcome-grid { grid-template-columns: 1fr; } }
 
 /* ── section divider ───────────────────────────────────────── */
 .section-label {
@@ -358,20 +369,22 @@ html, body, [data-testid="stAppViewContainer"] {
 
 /* fix toggle */
 [data-testid="stSidebar"] .stToggle label { color: rgba(255,255,255,0.75) !important; }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+
+st.html(style_tag(_CSS_MARKET))
 
 # ─── קבועים ─────────────────────────────────────────────────────────────────
-PROPERTY_TYPES = [
+PROPERTY_TYPES = (
     "דירה", "דירת גן", "פנטהאוז", "דופלקס",
     "בית פרטי", "קוטג׳", "דו-משפחתי", "טריפלקס", "מגרש",
-]
-ROOMS_OPTIONS  = ["לא צוין", "1", "1.5", "2", "2.5", "3", "3.5",
-                  "4", "4.5", "5", "5.5", "6", "7+"]
-FLOOR_OPTIONS  = ["לא צוין", "קרקע", "1", "2", "3", "4", "5", "6",
+)
+ROOMS_OPTIONS  = ("לא צוין", "1", "1.5", "2", "2.5", "3", "3.5",
+                  "4", "4.5", "5", "5.5", "6", "7+")
+FLOOR_OPTIONS  = ("לא צוין", "קרקע", "1", "2", "3", "4", "5", "6",
                   "7", "8", "9", "10", "11", "12", "13", "14", "15",
-                  "16", "17", "18", "19", "20", "21-25", "26-30", "פנטהאוז"]
-CONDITION_OPTIONS = ["לא צוין", "חדש מקבלן", "משופץ", "מצב טוב", "דורש שיפוץ"]
+                  "16", "17", "18", "19", "20", "21-25", "26-30", "פנטהאוז")
+CONDITION_OPTIONS = ("לא צוין", "חדש מקבלן", "משופץ", "מצב טוב", "דורש שיפוץ")
 PRICE_RANGES = {
     "לא צוין":         0,
     "עד 1,000,000 ₪":  1_000_000,
@@ -382,44 +395,141 @@ PRICE_RANGES = {
     "5–8 מיליון ₪":    8_000_000,
     "מעל 8 מיליון ₪": 12_000_000,
 }
-
-
-def _floor_to_int(s: str):
-    if s in ("לא צוין", ""):  return None
-    if s == "קרקע":           return 0
-    if s == "פנטהאוז":        return 30
-    if "-" in s:              return int(s.split("-")[0])
-    try:                      return int(s)
-    except ValueError:        return None
-
-
-def _rooms_to_float(s: str):
-    if s in ("לא צוין", ""): return None
-    if s == "7+":             return 7.0
-    try:                      return float(s)
-    except ValueError:        return None
+PRICE_RANGE_KEYS = tuple(PRICE_RANGES)
+
+
+# ─── HTML ────────────────────────────────────────────────────────────────────
+_SIDEBAR_LOGO_HTML = """
+<div style="padding:1.5rem 1rem 1.25rem;border-bottom:1px solid rgba(255,255,255,0.08);
+            margin-bottom:0.5rem;">
+    <div style="display:flex;align-items:center;gap:0.85rem;">
+        <div style="width:46px;height:46px;background:linear-gradient(135deg,#1C3F94,#2756C8);
+            border-radius:10px;border:1.5px solid #C9A84C;display:flex;align-items:center;
+            justify-content:center;font-family:Georgia,serif;font-size:1.4rem;font-weight:700;
+            color:#fff;flex-shrink:0;box-shadow:0 4px 12px rgba(0,0,0,0.3);">R</div>
+        <div>
+            <div style="color:#fff;font-size:1.05rem;font-weight:800;line-height:1.1;">Real Capital</div>
+            <div style="color:#C9A84C;font-size:0.63rem;letter-spacing:2.5px;
+                        text-transform:uppercase;margin-top:3px;">ניתוח שוק השוואתי</div>
+        </div>
+    </div>
+</div>
+"""
+
+_WELCOME_HERO_HTML = """
+<div style="text-align:center;padding:3rem 1rem 2rem;direction:rtl;">
+    <div style="display:inline-flex;align-items:center;gap:0.75rem;
+                background:rgba(28,63,148,0.07);border:1px solid rgba(28,63,148,0.15);
+                border-radius:30px;padding:0.4rem 1.25rem;margin-bottom:1.75rem;">
+        <span style="color:#1C3F94;font-size:0.8rem;font-weight:700;letter-spacing:1px;">
+            ⚡ פלטפורמת נדל"ן מקצועית
+        </span>
+    </div>
+    <h1 style="font-size:2.4rem;font-weight:900;color:#0B1F3B;margin:0 0 0.75rem;line-height:1.2;">
+        ניתוח שוק נדל"ן השוואתי
+    </h1>
+    <p style="color:#7B8FA3;font-size:1.05rem;max-width:520px;margin:0 auto 3rem;line-height:1.8;">
+        הכנס כתובת נכס בסרגל הצד וקבל דו"ח ניתוח שוק מקיף עם עסקאות אמיתיות,
+        גרפים, מגמות מחיר וסיכום בינה מלאכותית.
+    </p>
+</div>
+"""
+
+_WELCOME_CARDS = (
+    ("📈", "עסקאות אמיתיות",   "נדלן.gov.il — מאגר עסקאות ממשלתי רשמי"),
+    ("🏘️", "נכסים מפורסמים",  "יד2 — מחירי שוק עדכניים בזמן אמת"),
+    ("📊", "ניתוח מעמיק",      "קומה, גיל בניין, מגמות, השוואה"),
+    ("🤖", "סיכום AI בעברית", "Claude מנתח ומסכם את נתוני השוק"),
+)
+# ארבעת הכרטיסים ב-grid אחד: הודעת markdown אחת במקום st.columns(4) וארבע הודעות
+_WELCOME_CARDS_HTML = '<div class="welcome-grid">' + "".join(
+    f'<div class="welcome-card"><div class="welcome-card-icon">{icon}</div>'
+    f'<div class="welcome-card-title">{title}</div>'
+    f'<div class="welcome-card-sub">{sub}</div></div>'
+    for icon, title, sub in _WELCOME_CARDS
+) + "</div>"
+
+_WELCOME_PROCESS_HTML = """
+<div style="background:white;border-radius:20px;padding:2rem 2.5rem;
+            border:1px solid #E8ECF0;direction:rtl;
+            box-shadow:0 2px 16px rgba(11,31,59,0.05);">
+    <h3 style="color:#0B1F3B;font-weight:800;margin:0 0 1.5rem;">כיצד זה עובד?</h3>
+    <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:1.5rem;">
+        <div style="text-align:center;">
+            <div style="width:48px;height:48px;background:linear-gradient(135deg,#1C3F94,#4A90D9);
+                border-radius:12px;margin:0 auto 0.75rem;display:flex;align-items:center;
+                justify-content:center;font-size:1.3rem;">1️⃣</div>
+            <div style="font-weight:700;color:#0B1F3B;margin-bottom:0.3rem;">הכנס כתובת</div>
+            <div style="color:#7B8FA3;font-size:0.82rem;line-height:1.5;">
+                הקלד כתובת מלאה כולל שם העיר
+            </div>
+        </div>
+        <div style="text-align:center;">
+            <div style="width:48px;height:48px;background:linear-gradient(135deg,#1C3F94,#4A90D9);
+                border-radius:12px;margin:0 auto 0.75rem;display:flex;align-items:center;
+                justify-content:center;font-size:1.3rem;">2️⃣</div>
+            <div style="font-weight:700;color:#0B1F3B;margin-bottom:0.3rem;">בחר פרטי נכס</div>
+            <div style="color:#7B8FA3;font-size:0.82rem;line-height:1.5;">
+                סוג נכס, חדרים, שטח וקומה
+            </div>
+        </div>
+        <div style="text-align:center;">
+            <div style="width:48px;height:48px;background:linear-gradient(135deg,#1C3F94,#4A90D9);
+                border-radius:12px;margin:0 auto 0.75rem;display:flex;align-items:center;
+                justify-content:center;font-size:1.3rem;">3️⃣</div>
+            <div style="font-weight:700;color:#0B1F3B;margin-bottom:0.3rem;">קבל דו"ח מלא</div>
+            <div style="color:#7B8FA3;font-size:0.82rem;line-height:1.5;">
+                עסקאות, גרפים, הערכת שווי ו-PDF
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+_REPORT_HEADER_TEMPLATE = """
+<div class="report-header">
+    <div class="report-badge">📊 דו"ח ניתוח שוק</div>
+    <h2>{address}</h2>
+    <p>{property_type} &nbsp;|&nbsp; {city}
+       &nbsp;|&nbsp; מקורות: {sources}</p>
+</div>
+"""
+
+
+# ערך הבחירה בסרגל → ערך מספרי לניתוח (None = לא צוין)
+_FLOOR_VALUES = {
+    "לא צוין": None, "קרקע": 0, "פנטהאוז": 30, "21-25": 21, "26-30": 26,
+    **{str(i): i for i in range(1, 21)},
+}
+_ROOMS_VALUES = {
+    "לא צוין": None, "7+": 7.0,
+    **{opt: float(opt) for opt in ROOMS_OPTIONS[1:-1]},
+}
+_floor_to_int   = _FLOOR_VALUES.get
+_rooms_to_float = _ROOMS_VALUES.get
 
 
 # ─── Sidebar ─────────────────────────────────────────────────────────────────
-def _sidebar() -> dict:
+@dataclass(frozen=True, slots=True)
+class SidebarConfig:
+    """בחירות המשתמש בסרגל הצד לריצה הנוכחית."""
+
+    address: str
+    property_type: str
+    rooms: float | None
+    floor: int | None
+    size_sqm: int | None
+    condition: str
+    price: int | None
+    building_year: int | None
+    include_ai: bool
+    analyze: bool
+
+
+def _sidebar() -> SidebarConfig:
     with st.sidebar:
         # לוגו
-        st.markdown("""
-        <div style="padding:1.5rem 1rem 1.25rem;border-bottom:1px solid rgba(255,255,255,0.08);
-                    margin-bottom:0.5rem;">
-            <div style="display:flex;align-items:center;gap:0.85rem;">
-                <div style="width:46px;height:46px;background:linear-gradient(135deg,#1C3F94,#2756C8);
-                    border-radius:10px;border:1.5px solid #C9A84C;display:flex;align-items:center;
-                    justify-content:center;font-family:Georgia,serif;font-size:1.4rem;font-weight:700;
-                    color:#fff;flex-shrink:0;box-shadow:0 4px 12px rgba(0,0,0,0.3);">R</div>
-                <div>
-                    <div style="color:#fff;font-size:1.05rem;font-weight:800;line-height:1.1;">Real Capital</div>
-                    <div style="color:#C9A84C;font-size:0.63rem;letter-spacing:2.5px;
-                                text-transform:uppercase;margin-top:3px;">ניתוח שוק השוואתי</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SIDEBAR_LOGO_HTML, unsafe_allow_html=True)
 
         # כתובת הנכס
         st.markdown('<div class="section-label">📍 כתובת הנכס</div>', unsafe_allow_html=True)
@@ -450,7 +560,7 @@ def _sidebar() -> dict:
 
         # מחיר
         st.markdown('<div class="section-label">💰 מחיר</div>', unsafe_allow_html=True)
-        price_range_sel = st.selectbox("טווח מחיר", list(PRICE_RANGES.keys()),
+        price_range_sel = st.selectbox("טווח מחיר", PRICE_RANGE_KEYS,
                                        index=0, label_visibility="collapsed")
 
         # בניין
@@ -479,7 +589,7 @@ def _sidebar() -> dict:
                 unsafe_allow_html=True,
             )
 
-    return dict(
+    return SidebarConfig(
         address=address.strip(),
         property_type=property_type,
         rooms=_rooms_to_float(rooms_sel),
@@ -495,117 +605,101 @@ def _sidebar() -> dict:
 
 # ─── Welcome ─────────────────────────────────────────────────────────────────
 def _show_welcome():
-    st.markdown("""
-    <div style="text-align:center;padding:3rem 1rem 2rem;direction:rtl;">
-        <div style="display:inline-flex;align-items:center;gap:0.75rem;
-                    background:rgba(28,63,148,0.07);border:1px solid rgba(28,63,148,0.15);
-                    border-radius:30px;padding:0.4rem 1.25rem;margin-bottom:1.75rem;">
-            <span style="color:#1C3F94;font-size:0.8rem;font-weight:700;letter-spacing:1px;">
-                ⚡ פלטפורמת נדל"ן מקצועית
-            </span>
-        </div>
-        <h1 style="font-size:2.4rem;font-weight:900;color:#0B1F3B;margin:0 0 0.75rem;line-height:1.2;">
-            ניתוח שוק נדל"ן השוואתי
-        </h1>
-        <p style="color:#7B8FA3;font-size:1.05rem;max-width:520px;margin:0 auto 3rem;line-height:1.8;">
-            הכנס כתובת נכס בסרגל הצד וקבל דו"ח ניתוח שוק מקיף עם עסקאות אמיתיות,
-            גרפים, מגמות מחיר וסיכום בינה מלאכותית.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    cols = st.columns(4)
-    cards = [
-        ("📈", "עסקאות אמיתיות",   "נדלן.gov.il — מאגר עסקאות ממשלתי רשמי"),
-        ("🏘️", "נכסים מפורסמים",  "יד2 — מחירי שוק עדכניים בזמן אמת"),
-        ("📊", "ניתוח מעמיק",      "קומה, גיל בניין, מגמות, השוואה"),
-        ("🤖", "סיכום AI בעברית", "Claude מנתח ומסכם את נתוני השוק"),
-    ]
-    for col, (icon, title, sub) in zip(cols, cards):
-        with col:
-            st.markdown(f"""
-            <div class="welcome-card">
-                <div class="welcome-card-icon">{icon}</div>
-                <div class="welcome-card-title">{title}</div>
-                <div class="welcome-card-sub">{sub}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(_WELCOME_HERO_HTML, unsafe_allow_html=True)
+    st.markdown(_WELCOME_CARDS_HTML, unsafe_allow_html=True)
 
     st.markdown("<div style='margin-top:3rem'></div>", unsafe_allow_html=True)
 
     # הסבר תהליך
-    st.markdown("""
-    <div style="background:white;border-radius:20px;padding:2rem 2.5rem;
-                border:1px solid #E8ECF0;direction:rtl;
-                box-shadow:0 2px 16px rgba(11,31,59,0.05);">
-        <h3 style="color:#0B1F3B;font-weight:800;margin:0 0 1.5rem;">כיצד זה עובד?</h3>
-        <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:1.5rem;">
-            <div style="text-align:center;">
-                <div style="width:48px;height:48px;background:linear-gradient(135deg,#1C3F94,#4A90D9);
-                    border-radius:12px;margin:0 auto 0.75rem;display:flex;align-items:center;
-                    justify-content:center;font-size:1.3rem;">1️⃣</div>
-                <div style="font-weight:700;color:#0B1F3B;margin-bottom:0.3rem;">הכנס כתובת</div>
-                <div style="color:#7B8FA3;font-size:0.82rem;line-height:1.5;">
-                    הקלד כתובת מלאה כולל שם העיר
-                </div>
-            </div>
-            <div style="text-align:center;">
-                <div style="width:48px;height:48px;background:linear-gradient(135deg,#1C3F94,#4A90D9);
-                    border-radius:12px;margin:0 auto 0.75rem;display:flex;align-items:center;
-                    justify-content:center;font-size:1.3rem;">2️⃣</div>
-                <div style="font-weight:700;color:#0B1F3B;margin-bottom:0.3rem;">בחר פרטי נכס</div>
-                <div style="color:#7B8FA3;font-size:0.82rem;line-height:1.5;">
-                    סוג נכס, חדרים, שטח וקומה
-                </div>
-            </div>
-            <div style="text-align:center;">
-                <div style="width:48px;height:48px;background:linear-gradient(135deg,#1C3F94,#4A90D9);
-                    border-radius:12px;margin:0 auto 0.75rem;display:flex;align-items:center;
-                    justify-content:center;font-size:1.3rem;">3️⃣</div>
-                <div style="font-weight:700;color:#0B1F3B;margin-bottom:0.3rem;">קבל דו"ח מלא</div>
-                <div style="color:#7B8FA3;font-size:0.82rem;line-height:1.5;">
-                    עסקאות, גרפים, הערכת שווי ו-PDF
-                </div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_WELCOME_PROCESS_HTML, unsafe_allow_html=True)
 
 
 # ─── ניתוח ───────────────────────────────────────────────────────────────────
-def _run_analysis(cfg: dict):
+_REPORT_TTL = 3600        # שניות
+_REPORT_CACHE_MAX = 32    # דוחות לתהליך
+
+
+@st.cache_resource(show_spinner=False)
+def _report_cache() -> tuple[threading.Lock, dict]:
+    """מטמון דוחות משותף לתהליך: (פרמטרי ניתוח) → (זמן יצירה, דוח), ומנעול לגישה אליו.
+
+    לא st.cache_data: ה-progress callback כותב לאלמנטים שנוצרו מחוץ לפונקציה,
+    ו-cache_data היה משחזר אותם כאלמנטים חדשים בכל פגיעה במטמון.
+    המילון משותף לכל הסשנים (כל אחד ב-thread משלו) — כל קריאה וכתיבה תחת המנעול.
+    """
+    return threading.Lock(), {}
+
+
+def _analysis_key(cfg: SidebarConfig) -> tuple:
+    # tuple ולא ה-dataclass עצמו: המחלקה מוגדרת מחדש בכל rerun של הדף,
+    # ומופעים של מחלקות שונות לעולם אינם שווים — המטמון לא היה פוגע
+    return (cfg.address, cfg.property_type, cfg.rooms, cfg.floor,
+            cfg.size_sqm, cfg.building_year, cfg.price, cfg.include_ai)
+
+
+def _cached_report(key: tuple):
+    lock, cache = _report_cache()
+    with lock:
+        hit = cache.get(key)
+        if hit and time.monotonic() - hit[0] >= _REPORT_TTL:
+            del cache[key]
+            hit = None
+    return hit[1] if hit else None
+
+
+def _store_report(key: tuple, report) -> None:
+    """נקרא רק אחרי ניתוח חדש — זמן היצירה לא מתחדש בפגיעות, כך שה-TTL קשיח."""
+    lock, cache = _report_cache()
+    now = time.monotonic()
+    with lock:
+        for k in [k for k, (ts, _) in cache.items() if now - ts >= _REPORT_TTL]:
+            del cache[k]
+        # הכנסה רק בהחמצה, ולכן סדר המילון הוא סדר היצירה: הראשון הוא הוותיק
+        while len(cache) >= _REPORT_CACHE_MAX:
+            del cache[next(iter(cache))]
+        cache[key] = (now, report)
+
+
+def _fetch_report(cfg: SidebarConfig):
     container = st.empty()
-    with container.container():
-        progress_bar = st.progress(0, text="⏳ מתחיל ניתוח שוק...")
-        status_box   = st.empty()
+    progress_bar = container.progress(0, text="⏳ מתחיל ניתוח שוק...")
 
+    # הודעת השלב מוצגת כטקסט של פס ההתקדמות — עדכון אחד לכל אירוע
     def cb(msg, pct):
         progress_bar.progress(min(pct, 1.0), text=f"⏳ {msg}")
-        status_box.info(msg)
 
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        report = loop.run_until_complete(
+        report = asyncio.run(
             run_market_analysis(
-                address=cfg["address"],
-                property_type=cfg["property_type"],
-                rooms=cfg["rooms"],
-                floor=cfg["floor"],
-                size_sqm=cfg["size_sqm"],
-                building_year=cfg["building_year"],
-                price=cfg["price"],
-                include_ai=cfg["include_ai"],
+                address=cfg.address,
+                property_type=cfg.property_type,
+                rooms=cfg.rooms,
+                floor=cfg.floor,
+                size_sqm=cfg.size_sqm,
+                building_year=cfg.building_year,
+                price=cfg.price,
+                include_ai=cfg.include_ai,
                 progress_callback=cb,
             )
         )
-        loop.close()
     except Exception as e:
         container.empty()
         st.error(f"שגיאה בניתוח: {e}")
-        return
+        return None
 
     container.empty()
+    return report
+
+
+def _run_analysis(cfg: SidebarConfig):
+    key = _analysis_key(cfg)
+    report = _cached_report(key)
+    fresh = report is None
+    if fresh:
+        report = _fetch_report(cfg)
+        if report is None:
+            return
+
     st.session_state["report"] = report
 
     if report.errors:
@@ -625,59 +719,48 @@ def _run_analysis(cfg: dict):
         """)
         return
 
+    # דוח עם שגיאות (כשל זמני של nadlan/יד2) לא נשמר — ניסיון חוזר ינתח מחדש
+    if fresh and not report.errors:
+        _store_report(key, report)
     _display_report(report)
 
 
 # ─── תצוגת דוח ───────────────────────────────────────────────────────────────
 def _display_report(report):
+    # דוח ריק יכול להגיע מ-session_state אחרי ניתוח שלא מצא נתונים
+    if not (report.total_transactions or report.total_listings):
+        st.info("אין נתונים להצגה — נסה כתובת אחרת.")
+        return
+
     avg_sqm = report.avg_price_per_sqm_street
     val_str = report.value_estimation.formatted_range if report.value_estimation else "—"
 
     # כותרת
-    st.markdown(f"""
-    <div class="report-header">
-        <div class="report-badge">📊 דו"ח ניתוח שוק</div>
-        <h2>{report.subject_address}</h2>
-        <p>{report.subject_property_type} &nbsp;|&nbsp; {report.subject_city}
-           &nbsp;|&nbsp; מקורות: {", ".join(report.data_sources_used)}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # KPIs
-    c1, c2, c3, c4 = st.columns(4)
+    st.markdown(_REPORT_HEADER_TEMPLATE.format(
+        address=report.subject_address,
+        property_type=report.subject_property_type,
+        city=report.subject_city,
+        sources=", ".join(report.data_sources_used),
+    ), unsafe_allow_html=True)
+
+    # KPIs — grid אחד בהודעת markdown אחת
     kpis = [
         ("עסקאות שנמצאו",   str(report.total_transactions),    "מ-nadlan.gov.il"),
         ("נכסים מפורסמים",  str(report.total_listings),        "מ-יד2"),
         ("ממוצע למ\"ר",     f"₪{avg_sqm:,.0f}" if avg_sqm else "—",  "ברחוב"),
         ("הערכת שווי",      val_str,                           "על בסיס נתונים"),
     ]
-    for col, (lbl, val, sub) in zip([c1, c2, c3, c4], kpis):
-        with col:
-            st.markdown(f"""
-            <div class="kpi-card">
-                <div class="kpi-label">{lbl}</div>
-                <div class="kpi-value">{val}</div>
-                <div class="kpi-sub">{sub}</div>
-            </div>
-            """, unsafe_allow_html=True)
-            st.write("")
+    st.markdown('<div class="kpi-grid">' + "".join(
+        f'<div class="kpi-card"><div class="kpi-label">{lbl}</div>'
+        f'<div class="kpi-value">{val}</div><div class="kpi-sub">{sub}</div></div>'
+        for lbl, val, sub in kpis
+    ) + "</div>", unsafe_allow_html=True)
 
     # כפתור PDF
     st.markdown("<div style='margin:1rem 0 0.5rem'></div>", unsafe_allow_html=True)
     col_pdf, _, _ = st.columns([1, 1, 2])
     with col_pdf:
-        try:
-            pdf_buf  = generate_pdf(report)
-            safe_addr = report.subject_address.replace(" ", "_").replace(",", "")
-            st.download_button(
-                label="📄  הורד דו\"ח PDF",
-                data=pdf_buf,
-                file_name=f"ניתוח_שוק_{safe_addr}.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
-        except Exception:
-            pass
+        pdf_download(report, file_prefix="ניתוח_שוק")
 
     st.markdown("---")
 
@@ -697,82 +780,229 @@ def _display_report(report):
 
 
 # ─── לשוניות ─────────────────────────────────────────────────────────────────
-def _chart_layout(fig, title="", yaxis_title="", xaxis_title=""):
-    fig.update_layout(
-        title=dict(text=title, font=dict(size=15, family="Heebo", color="#0B1F3B")),
+@st.cache_resource(show_spinner=False)
+def _chart_template():
+    """תבנית plotly של המותג — נבנית פעם אחת לתהליך, על בסיס תבנית ברירת המחדל."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    template = go.layout.Template(pio.templates["plotly"])
+    template.layout.update(
+        title=dict(font=dict(size=15, family="Heebo", color="#0B1F3B")),
         font=dict(family="Heebo", color="#0B1F3B"),
         plot_bgcolor="white", paper_bgcolor="white",
-        xaxis=dict(gridcolor="#F0F2F7", title=xaxis_title),
-        yaxis=dict(gridcolor="#F0F2F7", title=yaxis_title, tickformat=","),
+        xaxis=dict(gridcolor="#F0F2F7"),
+        yaxis=dict(gridcolor="#F0F2F7", tickformat=","),
         margin=dict(t=50, r=20, b=40, l=20),
         showlegend=True,
     )
+    return template
+
+
+def _chart_layout(fig, title="", yaxis_title="", xaxis_title=""):
+    fig.update_layout(
+        template=_chart_template(),
+        title_text=title,
+        xaxis_title_text=xaxis_title,
+        yaxis_title_text=yaxis_title,
+        # px מציב margin.t=60 מפורש שגובר על התבנית; השוליים העליונים נכפים כמו קודם
+        margin_t=50,
+    )
     return fig
 
 
+# הגדרות plotly.js: המד הוא תצוגה סטטית — בלי מאזיני hover/zoom בכלל;
+# בגרפים הסיכומיים נשאר ה-hover, רק סרגל הכלים מוסר.
+_STATIC_PLOT = {"staticPlot": True}
+_NO_MODEBAR = {"displayModeBar": False}
+
+
+# ─── גרפים (במטמון) ──────────────────────────────────────────────────────────
+# כל בונה מקבל tuples של ערכים ומחזיר את ה-dict של הגרף, כך שמעבר בין לשוניות
+# או rerun על אותו דוח לא בונה ומאמת את אובייקט ה-Figure מחדש.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _sqm_histogram_fig(sqm_prices: tuple) -> dict:
+    import numpy as np
+    import plotly.express as px
+    # float32 כמו ב-_listings_fig: מחירים למ"ר שלמים מיוצגים בו במדויק
+    fig = px.histogram(
+        x=np.asarray(sqm_prices, dtype=np.float32), nbins=15,
+        labels={"x": "מחיר למ\"ר (₪)", "y": "מספר עסקאות"},
+        color_discrete_sequence=["#1C3F94"],
+    )
+    return _chart_layout(fig, "התפלגות מחיר למ\"ר",
+                         "מספר עסקאות", "מחיר למ\"ר (₪)").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _floor_fig(floors: tuple, avgs: tuple) -> dict:
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(
+        x=floors, y=avgs,
+        text=[f"₪{p:,.0f}" for p in avgs], textposition="outside",
+        marker_color="#1C3F94",
+        marker_line_color="#0B1F3B", marker_line_width=0.5,
+        hovertemplate="<b>%{x}</b><br>ממוצע: ₪%{y:,.0f}/מ\"ר<extra></extra>",
+    ))
+    return _chart_layout(fig, "ממוצע מחיר למ\"ר לפי קומה",
+                         "מחיר ממוצע למ\"ר (₪)", "קומה").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _age_fig(cats: tuple, avgs: tuple, prems: tuple) -> dict:
+    import plotly.graph_objects as go
+    colors = ["#2ECC71" if (p or 0) > 0 else "#E74C3C" if p is not None else "#95A5A6"
+              for p in prems]
+    fig = go.Figure(go.Bar(
+        x=cats, y=avgs,
+        text=[f"₪{p:,.0f}" + (f"\n({pr:+.1f}%)" if pr is not None else "")
+              for p, pr in zip(avgs, prems)],
+        textposition="outside",
+        marker_color=colors,
+        hovertemplate="<b>%{x}</b><br>ממוצע: ₪%{y:,.0f}/מ\"ר<extra></extra>",
+    ))
+    return _chart_layout(fig, "ממוצע מחיר למ\"ר לפי גיל בניין",
+                         "מחיר ממוצע למ\"ר (₪)").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _trends_fig(periods: tuple, prices: tuple) -> dict:
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Scatter(
+        x=periods, y=prices, mode="lines+markers",
+        line=dict(color="#1C3F94", width=3),
+        marker=dict(size=9, color="#0B1F3B", symbol="circle"),
+        fill="tozeroy", fillcolor="rgba(28,63,148,0.06)",
+        hovertemplate="<b>%{x}</b><br>ממוצע: ₪%{y:,.0f}/מ\"ר<extra></extra>",
+    ))
+    return _chart_layout(fig, "מגמת מחיר למ\"ר לאורך זמן",
+                         "מחיר ממוצע למ\"ר (₪)", "תקופה").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _listings_fig(tx_sqm: tuple, list_sqm: tuple) -> dict:
+    import numpy as np
+    import plotly.graph_objects as go
+    # מערכי numpy: plotly 6 מקודד אותם כ-typed arrays (base64) ולא כרשימת מספרים ב-JSON.
+    # float32 מספיק: מחיר למ"ר הוא מספר שלם ומיוצג בו במדויק עד ~16.7 מיליון.
+    fig = go.Figure(data=[
+        go.Box(y=np.asarray(tx_sqm, dtype=np.float32),
+               name="עסקאות שנסגרו",  marker_color="#0B1F3B"),
+        go.Box(y=np.asarray(list_sqm, dtype=np.float32),
+               name="מפורסמים (יד2)", marker_color="#4A90D9"),
+    ])
+    return _chart_layout(fig, "השוואת מחיר למ\"ר: עסקאות vs מפורסמים",
+                         "מחיר למ\"ר (₪)").to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _value_fig(low: float, mid: float, high: float) -> dict:
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=mid,
+        number={"suffix": " ₪", "valueformat": ",.0f",
+                "font": {"size": 28, "family": "Heebo"}},
+        gauge={
+            "axis": {"range": [low * 0.8, high * 1.2], "tickformat": ","},
+            "bar": {"color": "#1C3F94", "thickness": 0.3},
+            "steps": [
+                {"range": [low * 0.8, low],   "color": "#FADBD8"},
+                {"range": [low, high],        "color": "#D5F5E3"},
+                {"range": [high, high * 1.2], "color": "#FADBD8"},
+            ],
+            "threshold": {"line": {"color": "#C9A84C", "width": 3},
+                          "value": mid},
+        },
+        title={"text": "הערכת שווי הנכס", "font": {"size": 16, "family": "Heebo"}},
+    ))
+    fig.update_layout(height=340, font=dict(family="Heebo"),
+                      paper_bgcolor="white", margin=dict(t=60, b=20))
+    return fig.to_dict()
+
+
+_TX_FIELDS = {"address", "deal_amount", "rooms", "floor", "size_sqm",
+              "price_per_sqm", "building_year", "formatted_date"}
+
+
+_LISTING_FIELDS = {"address", "price", "rooms", "floor", "size_sqm",
+                   "price_per_sqm", "property_type"}
+
+
+def _int_or_dash(col: pd.Series, keep: pd.Series) -> pd.Series:
+    """עמודה מספרית לתצוגה: מספר שלם היכן ש-keep אמת, "—" בשאר."""
+    return (col // 1).astype("Int64").astype(object).where(keep, "—")
+
+
+def _shekels_or_dash(col: pd.Series, keep: pd.Series) -> pd.Series:
+    """עמודת מחיר לתצוגה: "₪1,234,567" היכן ש-keep אמת, "—" בשאר."""
+    # קטימה ל-int כמו ב-KPIs וב-PDF (לא עיגול של {:,.0f}) — אותו ₪ בכל מקום
+    return col[keep].astype("int64").map("₪{:,}".format).reindex(col.index, fill_value="—")
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _transactions_view(key: tuple, _txs) -> tuple:
+    """טבלת העסקאות, ה-KPIs וסדרת המחיר למ"ר — נבנים פעם אחת לכל דוח (key)."""
+    import pandas as pd
+    # DataFrame אחד משמש גם ל-KPIs, גם לטבלה וגם להיסטוגרמה
+    df = pd.DataFrame.from_records([tx.model_dump(include=_TX_FIELDS) for tx in _txs])
+    for col in ("rooms", "floor", "size_sqm", "price_per_sqm", "building_year"):
+        df[col] = pd.to_numeric(df[col])
+    prices     = df["deal_amount"][df["deal_amount"] > 0]
+    sqm_prices = df["price_per_sqm"].dropna()
+
+    price_kpis = (None if prices.empty
+                  else (int(prices.mean()), int(prices.min()), int(prices.max())))
+    sqm_avg = None if sqm_prices.empty else int(sqm_prices.mean())
+
+    table = pd.DataFrame({
+        "כתובת":       df["address"],
+        "מחיר (₪)":   _shekels_or_dash(df["deal_amount"], df["deal_amount"].notna()),
+        "חדרים":       df["rooms"].astype(object).where(df["rooms"].gt(0), "—"),
+        "קומה":        _int_or_dash(df["floor"], df["floor"].notna()),
+        "מ\"ר":        _int_or_dash(df["size_sqm"], df["size_sqm"].gt(0)),
+        "מחיר/מ\"ר":  _shekels_or_dash(df["price_per_sqm"], df["price_per_sqm"].gt(0)),
+        "שנת בנייה":   _int_or_dash(df["building_year"], df["building_year"].gt(0)),
+        "תאריך":       df["formatted_date"],
+    })
+    return table, price_kpis, sqm_avg, tuple(sqm_prices)
+
+
 def _tab_transactions(report):
+    import plotly.graph_objects as go
     txs = report.transactions
     if not txs:
         st.info("לא נמצאו עסקאות ברחוב זה. נסה לחפש בכתובת שונה.")
         return
 
-    prices     = [tx.deal_amount   for tx in txs if tx.deal_amount > 0]
-    sqm_prices = [tx.price_per_sqm for tx in txs if tx.price_per_sqm]
+    table, price_kpis, sqm_avg, sqm_prices = _transactions_view(report_key(report), txs)
 
     c1, c2, c3 = st.columns(3)
-    with c1:
-        if prices:
-            st.metric("מחיר ממוצע", f"₪{int(sum(prices)/len(prices)):,}")
-    with c2:
-        if sqm_prices:
-            st.metric("ממוצע למ\"ר", f"₪{int(sum(sqm_prices)/len(sqm_prices)):,}")
-    with c3:
-        if prices:
-            st.metric("טווח מחירים", f"₪{int(min(prices)):,} – ₪{int(max(prices)):,}")
+    if price_kpis:
+        avg, low, high = price_kpis
+        with c1: st.metric("מחיר ממוצע", f"₪{avg:,}")
+        with c3: st.metric("טווח מחירים", f"₪{low:,} – ₪{high:,}")
+    if sqm_avg is not None:
+        with c2: st.metric("ממוצע למ\"ר", f"₪{sqm_avg:,}")
 
     st.markdown("<div style='margin:1rem 0 0.5rem'></div>", unsafe_allow_html=True)
+    st.dataframe(table, use_container_width=True, hide_index=True)
 
-    data = [{
-        "כתובת":       tx.address,
-        "מחיר (₪)":   f"₪{int(tx.deal_amount):,}",
-        "חדרים":       tx.rooms or "—",
-        "קומה":        tx.floor if tx.floor is not None else "—",
-        "מ\"ר":        int(tx.size_sqm) if tx.size_sqm else "—",
-        "מחיר/מ\"ר":  f"₪{int(tx.price_per_sqm):,}" if tx.price_per_sqm else "—",
-        "שנת בנייה":   tx.building_year or "—",
-        "תאריך":       tx.formatted_date,
-    } for tx in txs]
-    st.dataframe(pd.DataFrame(data), use_container_width=True, hide_index=True)
-
-    if sqm_prices and len(sqm_prices) >= 3:
-        fig = px.histogram(
-            x=sqm_prices, nbins=15,
-            labels={"x": "מחיר למ\"ר (₪)", "y": "מספר עסקאות"},
-            color_discrete_sequence=["#1C3F94"],
-        )
-        st.plotly_chart(_chart_layout(fig, "התפלגות מחיר למ\"ר",
-                                      "מספר עסקאות", "מחיר למ\"ר (₪)"),
+    if len(sqm_prices) >= 3:
+        st.plotly_chart(go.Figure(_sqm_histogram_fig(sqm_prices)),
                         use_container_width=True)
 
 
 def _tab_floors(report):
+    import pandas as pd
+    import plotly.graph_objects as go
     fa_list = report.floor_analysis
     if not fa_list:
         st.info("אין מספיק נתונים לניתוח לפי קומה (נדרשות לפחות 3 עסקאות עם נתוני קומה)")
         return
 
-    floors = [f"קומה {fa.floor}" for fa in fa_list]
-    avgs   = [fa.avg_price_per_sqm for fa in fa_list]
-    fig = go.Figure(go.Bar(
-        x=floors, y=avgs,
-        text=[f"₪{p:,.0f}" for p in avgs], textposition="outside",
-        marker_color="#1C3F94",
-        marker_line_color="#0B1F3B", marker_line_width=0.5,
-        hovertemplate="<b>%{x}</b><br>ממוצע: ₪%{y:,.0f}/מ\"ר<extra></extra>",
-    ))
-    st.plotly_chart(_chart_layout(fig, "ממוצע מחיר למ\"ר לפי קומה",
-                                  "מחיר ממוצע למ\"ר (₪)", "קומה"),
-                    use_container_width=True)
+    # מעבר יחיד על הרשימה; zip(*...) מחזיר ישר את ה-tuples שהבונה במטמון מקבל
+    floors, avgs = zip(*((f"קומה {fa.floor}", fa.avg_price_per_sqm) for fa in fa_list))
+    st.plotly_chart(go.Figure(_floor_fig(floors, avgs)), use_container_width=True)
 
     floor_data = [{
         "קומה":           fa.floor,
@@ -784,28 +1014,16 @@ def _tab_floors(report):
 
 
 def _tab_age(report):
+    import plotly.graph_objects as go
     ba_list = report.building_age_analysis
     if not ba_list:
         st.info("אין מספיק נתונים לניתוח לפי גיל בניין")
         return
 
-    cats    = [ba.category for ba in ba_list]
-    avgs    = [ba.avg_price_per_sqm for ba in ba_list]
-    prems   = [ba.price_premium_pct for ba in ba_list]
-    colors  = ["#2ECC71" if (p or 0) > 0 else "#E74C3C" if p is not None else "#95A5A6"
-               for p in prems]
-
-    fig = go.Figure(go.Bar(
-        x=cats, y=avgs,
-        text=[f"₪{p:,.0f}" + (f"\n({pr:+.1f}%)" if pr is not None else "")
-              for p, pr in zip(avgs, prems)],
-        textposition="outside",
-        marker_color=colors,
-        hovertemplate="<b>%{x}</b><br>ממוצע: ₪%{y:,.0f}/מ\"ר<extra></extra>",
-    ))
-    st.plotly_chart(_chart_layout(fig, "ממוצע מחיר למ\"ר לפי גיל בניין",
-                                  "מחיר ממוצע למ\"ר (₪)"),
-                    use_container_width=True)
+    cats, avgs, prems = zip(*((ba.category, ba.avg_price_per_sqm, ba.price_premium_pct)
+                              for ba in ba_list))
+    st.plotly_chart(go.Figure(_age_fig(cats, avgs, prems)), use_container_width=True,
+                    config=_NO_MODEBAR)
 
     cols = st.columns(len(ba_list))
     for i, ba in enumerate(ba_list):
@@ -817,24 +1035,15 @@ def _tab_age(report):
 
 
 def _tab_trends(report):
+    import plotly.graph_objects as go
     trends = report.price_trends
     if not trends:
         st.info("אין מספיק נתונים להצגת מגמות מחיר")
         return
 
-    periods = [pt.period for pt in trends]
-    prices  = [pt.avg_price_per_sqm for pt in trends]
-
-    fig = go.Figure(go.Scatter(
-        x=periods, y=prices, mode="lines+markers",
-        line=dict(color="#1C3F94", width=3),
-        marker=dict(size=9, color="#0B1F3B", symbol="circle"),
-        fill="tozeroy", fillcolor="rgba(28,63,148,0.06)",
-        hovertemplate="<b>%{x}</b><br>ממוצע: ₪%{y:,.0f}/מ\"ר<extra></extra>",
-    ))
-    st.plotly_chart(_chart_layout(fig, "מגמת מחיר למ\"ר לאורך זמן",
-                                  "מחיר ממוצע למ\"ר (₪)", "תקופה"),
-                    use_container_width=True)
+    periods, prices = zip(*((pt.period, pt.avg_price_per_sqm) for pt in trends))
+    st.plotly_chart(go.Figure(_trends_fig(periods, prices)), use_container_width=True,
+                    config=_NO_MODEBAR)
 
     if len(trends) >= 2:
         first, last = trends[0], trends[-1]
@@ -847,34 +1056,37 @@ def _tab_trends(report):
 
 
 def _tab_listings(report):
+    import pandas as pd
+    import plotly.graph_objects as go
     listings = report.current_listings
     if not listings:
         st.info("לא נמצאו נכסים מפורסמים דומים ביד2")
         return
 
-    data = [{
-        "כתובת":      l.address,
-        "מחיר (₪)":  f"₪{int(l.price):,}" if l.price > 0 else "—",
-        "חדרים":      l.rooms or "—",
-        "קומה":       l.floor if l.floor is not None else "—",
-        "מ\"ר":       int(l.size_sqm) if l.size_sqm else "—",
-        "מחיר/מ\"ר": f"₪{int(l.price_per_sqm):,}" if l.price_per_sqm else "—",
-        "סוג נכס":    l.property_type,
-    } for l in listings]
-    st.dataframe(pd.DataFrame(data), use_container_width=True, hide_index=True)
-
-    tx_sqm   = [tx.price_per_sqm for tx in report.transactions if tx.price_per_sqm]
-    list_sqm = [l.price_per_sqm  for l  in listings           if l.price_per_sqm]
+    df = pd.DataFrame.from_records([l.model_dump(include=_LISTING_FIELDS) for l in listings])
+    for col in ("rooms", "floor", "size_sqm", "price_per_sqm"):
+        df[col] = pd.to_numeric(df[col])
+
+    table = pd.DataFrame({
+        "כתובת":      df["address"],
+        "מחיר (₪)":  _shekels_or_dash(df["price"], df["price"].gt(0)),
+        "חדרים":      df["rooms"].astype(object).where(df["rooms"].gt(0), "—"),
+        "קומה":       _int_or_dash(df["floor"], df["floor"].notna()),
+        "מ\"ר":       _int_or_dash(df["size_sqm"], df["size_sqm"].gt(0)),
+        "מחיר/מ\"ר": _shekels_or_dash(df["price_per_sqm"], df["price_per_sqm"].gt(0)),
+        "סוג נכס":    df["property_type"],
+    })
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    tx_sqm   = tuple(tx.price_per_sqm for tx in report.transactions if tx.price_per_sqm)
+    list_sqm = tuple(df["price_per_sqm"].dropna())
     if tx_sqm and list_sqm:
-        fig = go.Figure()
-        fig.add_trace(go.Box(y=tx_sqm,   name="עסקאות שנסגרו",  marker_color="#0B1F3B"))
-        fig.add_trace(go.Box(y=list_sqm, name="מפורסמים (יד2)", marker_color="#4A90D9"))
-        st.plotly_chart(_chart_layout(fig, "השוואת מחיר למ\"ר: עסקאות vs מפורסמים",
-                                      "מחיר למ\"ר (₪)"),
-                        use_container_width=True)
+        st.plotly_chart(go.Figure(_listings_fig(tx_sqm, list_sqm)),
+                        use_container_width=True, config=_NO_MODEBAR)
 
 
 def _tab_value(report):
+    import plotly.graph_objects as go
     ve = report.value_estimation
     if not ve:
         st.warning("אין מספיק נתונים להערכת שווי (נדרשות לפחות 3 עסקאות דומות)")
@@ -892,50 +1104,66 @@ def _tab_value(report):
         st.metric("רמת ביטחון", f"{emoji} {ve.confidence}")
     st.caption(f"מבוסס על {ve.comparable_count} נכסים | {ve.methodology}")
 
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=ve.estimated_price_mid,
-        number={"suffix": " ₪", "valueformat": ",.0f",
-                "font": {"size": 28, "family": "Heebo"}},
-        gauge={
-            "axis": {"range": [ve.estimated_price_low * 0.8,
-                                ve.estimated_price_high * 1.2],
-                     "tickformat": ","},
-            "bar": {"color": "#1C3F94", "thickness": 0.3},
-            "steps": [
-                {"range": [ve.estimated_price_low * 0.8, ve.estimated_price_low], "color": "#FADBD8"},
-                {"range": [ve.estimated_price_low, ve.estimated_price_high],      "color": "#D5F5E3"},
-                {"range": [ve.estimated_price_high, ve.estimated_price_high * 1.2],"color": "#FADBD8"},
-            ],
-            "threshold": {"line": {"color": "#C9A84C", "width": 3},
-                          "value": ve.estimated_price_mid},
-        },
-        title={"text": "הערכת שווי הנכס", "font": {"size": 16, "family": "Heebo"}},
-    ))
-    fig.update_layout(height=340, font=dict(family="Heebo"),
-                      paper_bgcolor="white", margin=dict(t=60, b=20))
-    st.plotly_chart(fig, use_container_width=True)
+    fig = _value_fig(ve.estimated_price_low, ve.estimated_price_mid, ve.estimated_price_high)
+    st.plotly_chart(go.Figure(fig), use_container_width=True, config=_STATIC_PLOT)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _ai_card_html(summary: str) -> str:
+    """הסיכום הוא טקסט חופשי מהמודל: escape ל-HTML ושבירות שורה ל-<br>, פעם אחת לכל סיכום."""
+    return f'<div class="ai-card">{html.escape(summary).replace(chr(10), "<br>")}</div>'
 
 
 def _tab_ai(report):
     if not report.ai_summary:
         st.info("סיכום AI לא נוצר — הפעל את האפשרות 'סיכום AI חכם' בסרגל הצד ונסה שוב.")
         return
-    st.markdown(
-        f'<div class="ai-card">{report.ai_summary.replace(chr(10), "<br>")}</div>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(_ai_card_html(report.ai_summary), unsafe_allow_html=True)
+
+
+# ─── דיבוג ───────────────────────────────────────────────────────────────────
+def _cache_stats_panel() -> None:
+    """גודל המטמונים בסרגל הצד — מוצג רק כש-MARKET_DEBUG מוגדר בסביבה."""
+    with st.sidebar.expander("🐞 מטמון"):
+        lock, cache = _report_cache()
+        with lock:
+            count = len(cache)
+        st.caption(f"דוחות במטמון: {count}")
+        # API פנימי של Streamlit: צורת ההחזרה משתנה בין גרסאות (רשימה / dict של
+        # רשימות), וכשל כאן מפיל רק את הפאנל — לעולם לא את הדף
+        try:
+            from streamlit.runtime.caching import (
+                get_data_cache_stats_provider,
+                get_resource_cache_stats_provider,
+            )
+            totals: dict[str, list[int]] = {}
+            for provider in (get_data_cache_stats_provider(),
+                             get_resource_cache_stats_provider()):
+                stats = provider.get_stats()
+                if isinstance(stats, dict):
+                    stats = [stat for group in stats.values() for stat in group]
+                for stat in stats:
+                    entry = totals.setdefault(stat.cache_name, [0, 0])
+                    entry[0] += 1
+                    entry[1] += stat.byte_length
+        except Exception:
+            st.caption("גרסת Streamlit זו לא חושפת סטטיסטיקות מטמון")
+            return
+
+        st.json({name: {"entries": n, "bytes": size} for name, (n, size) in totals.items()})
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 def main():
     cfg = _sidebar()
+    if os.environ.get("MARKET_DEBUG"):
+        _cache_stats_panel()
 
-    if not cfg["address"]:
+    if not cfg.address:
         _show_welcome()
         return
 
-    if cfg["analyze"]:
+    if cfg.analyze:
         _run_analysis(cfg)
     elif "report" in st.session_state:
         _display_report(st.session_state["report"])
@@ -3,10 +3,14 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:  # הסקריפט רץ מחדש בכל rerun — בלי כפילויות ב-sys.path
+    sys.path.insert(0, _ROOT)
 
 import streamlit as st
 
+from src.ui.shell import FOOTER_HTML, style_tag
+
 st.set_page_config(
     page_title="פרסום לפייסבוק | Real Capital",
     page_icon="📱",
@@ -14,8 +18,7 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-st.markdown("""
-<style>
+_CSS_POSTER = """
 @import url('https://fonts.googleapis.com/css2?family=Heebo:wght@300;400;500;600;700;800;900&display=swap');
 
 *, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
@@ -218,11 +221,13 @@ html, body, [data-testid="stAppViewContainer"], [data-testid="stMain"] {
 .footer { background: #0B1F3B; padding: 2rem 3rem; text-align: center; margin-top: 3rem; }
 .footer p { color: rgba(255,255,255,0.4); font-size: 0.8rem; }
 .footer strong { color: #C9A84C; }
-</style>
-""", unsafe_allow_html=True)
+"""
+
 
-# ─── Navbar ───────────────────────────────────────────────────────────────────
-st.markdown("""
+st.html(style_tag(_CSS_POSTER))
+
+# ─── HTML ────────────────────────────────────────────────────────────────────
+_NAVBAR_HTML = """
 <div class="nav-bar">
     <div class="nav-logo">
         <div class="nav-logo-mark">R</div>
@@ -234,10 +239,9 @@ st.markdown("""
     <a class="back-link" href="/">← חזרה לדשבורד</a>
     <span class="nav-badge">רוי עידו | מתווך</span>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-# ─── Hero ─────────────────────────────────────────────────────────────────────
-st.markdown("""
+_HERO_HTML = """
 <div class="fb-hero">
     <div class="fb-hero-icon">📱</div>
     <div class="status-badge">
@@ -247,13 +251,9 @@ st.markdown("""
     <h1>פרסום אוטומטי לפייסבוק</h1>
     <p>פרסם נכסים אוטומטית לקבוצות פייסבוק ישירות מ-Notion — עם תמונות, תיאור מעוצב וחתימה אישית.</p>
 </div>
-""", unsafe_allow_html=True)
-
-# ─── Main content ─────────────────────────────────────────────────────────────
-st.markdown('<div class="content-wrap">', unsafe_allow_html=True)
+"""
 
-# Why local only
-st.markdown("""
+_WHY_HTML = """
 <div class="section-header">
     <h2>🔒 למה רק מקומית?</h2>
     <p>פרסום לפייסבוק דורש גישה ישירה לדפדפן שלך — זה לא אפשרי דרך שרת ענן</p>
@@ -288,10 +288,9 @@ st.markdown("""
         </div>
     </div>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-# Features
-st.markdown("""
+_FEATURES_HTML = """
 <div class="info-card blue" style="margin-top:1.5rem">
     <h3>✨ מה הכלי עושה</h3>
     <ul class="feat-list">
@@ -304,10 +303,9 @@ st.markdown("""
         <li><span class="check">✓</span> מדווח על הצלחה/כישלון לכל קבוצה</li>
     </ul>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-# Setup steps
-st.markdown("""
+_STEPS_HTML = """
 <div class="info-card navy">
     <h3>🚀 איך להפעיל מקומית</h3>
     <div class="steps-wrap">
@@ -350,10 +348,9 @@ st.markdown("""
         </div>
     </div>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-# Callout to CMA
-st.markdown("""
+_CALLOUT_HTML = """
 <div class="callout">
     <span class="callout-icon">📊</span>
     <div class="callout-text">
@@ -361,18 +358,22 @@ st.markdown("""
         <p>כלי ניתוח השוק (CMA) פועל כאן ב-Cloud ומוכן לשימוש עכשיו. הפק דו"ח מקצועי לכל נכס תוך דקות.</p>
     </div>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-st.markdown('</div>', unsafe_allow_html=True)
 
-# ─── Footer ───────────────────────────────────────────────────────────────────
-st.markdown("""
-<div class="footer">
-    <div style="display:flex;align-items:center;justify-content:center;gap:0.75rem;margin-bottom:0.75rem;">
-        <div style="width:32px;height:32px;background:#1C3F94;border-radius:6px;border:1px solid #C9A84C;display:flex;align-items:center;justify-content:center;font-family:Georgia,serif;font-size:1rem;font-weight:700;color:#fff;">R</div>
-        <span style="color:#C9A84C;font-weight:700;font-size:1rem;">Real Capital</span>
-    </div>
-    <p>רוי עידו | 050-592-2642 | roy11ido@gmail.com</p>
-    <p style="margin-top:0.5rem">© 2025 כל הזכויות שמורות</p>
-</div>
-""", unsafe_allow_html=True)
+# ─── Render ──────────────────────────────────────────────────────────────────
+# הדף כולו סטטי: מחרוזת אחת ו-st.html יחיד (כמו בדף הבית) במקום הודעה לכל
+# מקטע — וכך גם ה-content-wrap עוטף באמת את התוכן שבתוכו.
+_PAGE_HTML = (
+    _NAVBAR_HTML
+    + _HERO_HTML
+    + '<div class="content-wrap">'
+    + _WHY_HTML
+    + _FEATURES_HTML
+    + _STEPS_HTML
+    + _CALLOUT_HTML
+    + "</div>"
+    + FOOTER_HTML
+)
+
+st.html(_PAGE_HTML)
@@ -5,7 +5,9 @@ import sys
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:  # the script re-runs on every rerun; don't grow sys.path
+    sys.path.insert(0, _ROOT)
 
 import streamlit as st
 
@@ -22,9 +24,7 @@ st.set_page_config(
 )
 
 # --- Custom CSS for RTL support ---
-st.markdown(
-    """
-    <style>
+_CSS_GUI = """
     .rtl-text {
         direction: rtl;
         text-align: right;
@@ -46,10 +46,10 @@ st.markdown(
     .stButton > button {
         width: 100%;
     }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+"""
+
+
+st.html(f"<style>{_CSS_GUI}</style>")
 
 
 def main():
@@ -102,6 +102,16 @@ def main():
 
     st.subheader(f"📋 נכסים בשיווק ({len(properties)})")
 
+    _property_selection(properties, groups, session_exists)
+
+
+@st.fragment
+def _property_selection(properties: list, groups: list[dict], session_exists: bool):
+    """Property checkboxes, post button and run log.
+
+    Runs as a fragment so ticking a checkbox reruns only this block instead
+    of the whole script (session check, groups file, Notion fetch).
+    """
     # --- Select All / Clear All buttons ---
     col1, col2, col3 = st.columns([1, 1, 4])
 
@@ -112,11 +122,11 @@ def main():
     with col1:
         if st.button("✅ סמן הכל"):
             st.session_state.select_all = True
-            st.rerun()
+            st.rerun(scope="fragment")
     with col2:
         if st.button("❎ נקה הכל"):
             st.session_state.select_all = False
-            st.rerun()
+            st.rerun(scope="fragment")
 
     st.divider()
 
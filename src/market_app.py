@@ -1,20 +1,27 @@
 """Streamlit page for Market Analysis Report generation."""
 
+from __future__ import annotations
+
 import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:  # the script re-runs on every rerun; don't grow sys.path
+    sys.path.insert(0, _ROOT)
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# plotly and pandas are imported inside the render helpers that use them:
+# the instructions screen needs neither, and plotly is slow to import cold.
 from src.market.orchestrator import run_market_analysis
-from src.market.pdf_report import generate_pdf
 from src.market.models import MarketAnalysisReport
+from src.ui.pdf import pdf_download
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -63,11 +70,35 @@ st.markdown(
     .stButton > button {
         width: 100%;
     }
+    .features-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+        direction: rtl;
+    }
+    .feature-item h4 {
+        margin: 0 0 0.3rem;
+        font-size: 1rem;
+    }
+    .feature-item p {
+        margin: 0;
+        font-size: 0.85rem;
+        opacity: 0.6;
+    }
     </style>
     """,
     unsafe_allow_html=True,
 )
 
+# --- Static "what the report includes" grid (one element instead of 3 columns) ---
+_FEATURES_HTML = """
+<div class="features-grid">
+    <div class="feature-item"><h4>📈 עסקאות</h4><p>עסקאות שנסגרו מ-nadlan.gov.il</p></div>
+    <div class="feature-item"><h4>🏘️ נכסים מפורסמים</h4><p>נכסים דומים כרגע ביד2</p></div>
+    <div class="feature-item"><h4>🤖 סיכום AI</h4><p>ניתוח מקצועי של Claude</p></div>
+</div>
+"""
+
 # --- Property types ---
 PROPERTY_TYPES = [
     "דירה", "פנטהאוז", "בית פרטי", "קוטג׳",
@@ -158,16 +189,7 @@ def _show_instructions():
     """)
 
     st.markdown("### מה הדו\"ח כולל?")
-    cols = st.columns(3)
-    with cols[0]:
-        st.markdown("**📈 עסקאות**")
-        st.caption("עסקאות שנסגרו מ-nadlan.gov.il")
-    with cols[1]:
-        st.markdown("**🏘️ נכסים מפורסמים**")
-        st.caption("נכסים דומים כרגע ביד2")
-    with cols[2]:
-        st.markdown("**🤖 סיכום AI**")
-        st.caption("ניתוח מקצועי של Claude")
+    st.html(_FEATURES_HTML)
 
 
 def _run_analysis(
@@ -249,18 +271,7 @@ def _display_report(report: MarketAnalysisReport):
     # --- PDF Download ---
     col_pdf, col_info = st.columns([1, 3])
     with col_pdf:
-        try:
-            pdf_buffer = generate_pdf(report)
-            safe_addr = report.subject_address.replace(" ", "_").replace(",", "")
-            st.download_button(
-                label="📄 הורד דו\"ח PDF",
-                data=pdf_buffer,
-                file_name=f"market_analysis_{safe_addr}.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
-        except Exception as e:
-            st.error(f"שגיאה ביצירת PDF: {e}")
+        pdf_download(report, file_prefix="market_analysis")
     with col_info:
         st.caption(
             f"סוג נכס: {report.subject_property_type} | "
@@ -308,40 +319,81 @@ def _display_report(report: MarketAnalysisReport):
         _render_ai_tab(report)
 
 
+# Model field -> Hebrew column header, in display order
+_TX_COLUMNS = {
+    "address": "כתובת",
+    "deal_amount": "מחיר (ש\"ח)",
+    "rooms": "חדרים",
+    "floor": "קומה",
+    "size_sqm": "מ\"ר",
+    "price_per_sqm": "מחיר/מ\"ר",
+    "building_year": "שנת בנייה",
+    "formatted_date": "תאריך",
+}
+_LISTING_COLUMNS = {
+    "address": "כתובת",
+    "price": "מחיר (ש\"ח)",
+    "rooms": "חדרים",
+    "floor": "קומה",
+    "size_sqm": "מ\"ר",
+    "price_per_sqm": "מחיר/מ\"ר",
+    "property_type": "סוג",
+}
+_TX_FIELDS = set(_TX_COLUMNS)
+_LISTING_FIELDS = set(_LISTING_COLUMNS)
+_WHOLE_NUMBER_FIELDS = {"deal_amount", "price", "floor", "size_sqm", "price_per_sqm", "building_year"}
+_ZERO_SHOWN_FIELDS = {"floor", "deal_amount"}
+
+
+def _display_table(records: list[dict], columns: dict[str, str]) -> pd.DataFrame:
+    """Build a display table column-wise from model dumps, then rename to Hebrew.
+
+    Numeric fields are shown as whole numbers and missing values as blanks.
+    Zero is blank too, except for the floor, where 0 is the ground floor,
+    and the transaction deal amount, which has always been shown as is.
+    """
+    import pandas as pd
+    df = pd.DataFrame.from_records(records, columns=list(columns))
+    for field in df.columns:
+        if field != "rooms" and field not in _WHOLE_NUMBER_FIELDS:
+            continue
+        values = pd.to_numeric(df[field])
+        keep = values.notna() if field in _ZERO_SHOWN_FIELDS else values.gt(0)
+        if field in _WHOLE_NUMBER_FIELDS:
+            values = (values // 1).astype("Int64")
+        df[field] = values.astype(object).where(keep, "")
+    return df.rename(columns=columns)
+
+
 def _render_transactions_tab(report: MarketAnalysisReport):
     """Render the transactions data tab."""
+    import plotly.express as px
     st.subheader("עסקאות דומות שנמצאו")
 
     if not report.transactions:
         st.info("לא נמצאו עסקאות")
         return
 
-    # Convert to DataFrame
-    data = []
+    # Single pass: table records plus the price lists for the metrics and chart
+    records, prices, sqm_prices = [], [], []
     for tx in report.transactions:
-        data.append({
-            "כתובת": tx.address,
-            "מחיר (ש\"ח)": int(tx.deal_amount),
-            "חדרים": tx.rooms or "",
-            "קומה": tx.floor if tx.floor is not None else "",
-            "מ\"ר": int(tx.size_sqm) if tx.size_sqm else "",
-            "מחיר/מ\"ר": int(tx.price_per_sqm) if tx.price_per_sqm else "",
-            "שנת בנייה": tx.building_year or "",
-            "תאריך": tx.formatted_date,
-        })
+        record = tx.model_dump(include=_TX_FIELDS)
+        if tx.deal_amount > 0:
+            prices.append(tx.deal_amount)
+        if record["price_per_sqm"]:
+            sqm_prices.append(record["price_per_sqm"])
+        records.append(record)
 
-    df = pd.DataFrame(data)
+    df = _display_table(records, _TX_COLUMNS)
 
     # Display statistics
     col1, col2, col3 = st.columns(3)
     with col1:
-        prices = [tx.deal_amount for tx in report.transactions if tx.deal_amount > 0]
         if prices:
             st.metric("מחיר ממוצע", f"{int(sum(prices)/len(prices)):,} ש\"ח")
     with col2:
-        sqm = [tx.price_per_sqm for tx in report.transactions if tx.price_per_sqm]
-        if sqm:
-            st.metric("ממוצע למ\"ר", f"{int(sum(sqm)/len(sqm)):,} ש\"ח")
+        if sqm_prices:
+            st.metric("ממוצע למ\"ר", f"{int(sum(sqm_prices)/len(sqm_prices)):,} ש\"ח")
     with col3:
         if prices:
             st.metric("טווח", f"{int(min(prices)):,} - {int(max(prices)):,}")
@@ -350,7 +402,6 @@ def _render_transactions_tab(report: MarketAnalysisReport):
 
     # Price distribution chart
     if len(report.transactions) >= 3:
-        sqm_prices = [tx.price_per_sqm for tx in report.transactions if tx.price_per_sqm]
         if sqm_prices:
             fig = px.histogram(
                 x=sqm_prices,
@@ -369,6 +420,8 @@ def _render_transactions_tab(report: MarketAnalysisReport):
 
 def _render_floor_tab(report: MarketAnalysisReport):
     """Render floor price analysis tab."""
+    import pandas as pd
+    import plotly.graph_objects as go
     st.subheader("ניתוח מחיר לפי קומה")
 
     if not report.floor_analysis:
@@ -380,8 +433,7 @@ def _render_floor_tab(report: MarketAnalysisReport):
     avg_prices = [fa.avg_price_per_sqm for fa in report.floor_analysis]
     counts = [fa.transaction_count for fa in report.floor_analysis]
 
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
+    fig = go.Figure(go.Bar(
         x=floors,
         y=avg_prices,
         text=[f"{p:,.0f}" for p in avg_prices],
@@ -411,6 +463,7 @@ def _render_floor_tab(report: MarketAnalysisReport):
 
 def _render_age_tab(report: MarketAnalysisReport):
     """Render building age analysis tab."""
+    import plotly.graph_objects as go
     st.subheader("השוואת ישן מול חדש")
 
     if not report.building_age_analysis:
@@ -431,8 +484,7 @@ def _render_age_tab(report: MarketAnalysisReport):
         else:
             colors.append("#e74c3c")
 
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
+    fig = go.Figure(go.Bar(
         x=categories,
         y=avg_prices,
         text=[f"{p:,.0f}\n({pr:+.1f}%)" if pr is not None else f"{p:,.0f}" for p, pr in zip(avg_prices, premiums)],
@@ -465,6 +517,7 @@ def _render_age_tab(report: MarketAnalysisReport):
 
 def _render_trends_tab(report: MarketAnalysisReport):
     """Render price trends tab."""
+    import plotly.graph_objects as go
     st.subheader("מגמות מחיר לאורך זמן")
 
     if not report.price_trends:
@@ -475,8 +528,7 @@ def _render_trends_tab(report: MarketAnalysisReport):
     periods = [pt.period for pt in report.price_trends]
     prices = [pt.avg_price_per_sqm for pt in report.price_trends]
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
+    fig = go.Figure(go.Scatter(
         x=periods,
         y=prices,
         mode="lines+markers",
@@ -518,25 +570,15 @@ def _render_trends_tab(report: MarketAnalysisReport):
 
 def _render_listings_tab(report: MarketAnalysisReport):
     """Render current Yad2 listings tab."""
+    import plotly.graph_objects as go
     st.subheader("נכסים מפורסמים כרגע (יד2)")
 
     if not report.current_listings:
         st.info("לא נמצאו נכסים מפורסמים דומים")
         return
 
-    data = []
-    for l in report.current_listings:
-        data.append({
-            "כתובת": l.address,
-            "מחיר (ש\"ח)": int(l.price) if l.price > 0 else "",
-            "חדרים": l.rooms or "",
-            "קומה": l.floor if l.floor is not None else "",
-            "מ\"ר": int(l.size_sqm) if l.size_sqm else "",
-            "מחיר/מ\"ר": int(l.price_per_sqm) if l.price_per_sqm else "",
-            "סוג": l.property_type,
-        })
-
-    st.dataframe(pd.DataFrame(data), use_container_width=True, hide_index=True)
+    records = [l.model_dump(include=_LISTING_FIELDS) for l in report.current_listings]
+    st.dataframe(_display_table(records, _LISTING_COLUMNS), use_container_width=True, hide_index=True)
 
     # Comparison chart: listings vs transactions
     if report.transactions:
@@ -544,17 +586,18 @@ def _render_listings_tab(report: MarketAnalysisReport):
         list_sqm = [l.price_per_sqm for l in report.current_listings if l.price_per_sqm]
 
         if tx_sqm and list_sqm:
-            fig = go.Figure()
-            fig.add_trace(go.Box(
-                y=tx_sqm,
-                name="עסקאות (נסגרו)",
-                marker_color="#3498db",
-            ))
-            fig.add_trace(go.Box(
-                y=list_sqm,
-                name="מפורסמים (יד2)",
-                marker_color="#e74c3c",
-            ))
+            fig = go.Figure(data=[
+                go.Box(
+                    y=tx_sqm,
+                    name="עסקאות (נסגרו)",
+                    marker_color="#3498db",
+                ),
+                go.Box(
+                    y=list_sqm,
+                    name="מפורסמים (יד2)",
+                    marker_color="#e74c3c",
+                ),
+            ])
             fig.update_layout(
                 title="השוואת מחיר למ\"ר: עסקאות vs מפורסמים",
                 yaxis_title="מחיר למ\"ר (ש\"ח)",
@@ -565,6 +608,7 @@ def _render_listings_tab(report: MarketAnalysisReport):
 
 def _render_value_tab(report: MarketAnalysisReport):
     """Render value estimation tab."""
+    import plotly.graph_objects as go
     st.subheader("הערכת שווי")
 
     if not report.value_estimation:
@@ -0,0 +1,54 @@
+"""
+הורדת דו"ח ה-PDF — כפתור "הכן" ואחריו כפתור הורדה, משותף לשני דפי ניתוח השוק.
+
+המודול מיובא פעם אחת לתהליך, כך שמטמון ה-PDF משותף לכל הסשנים.
+
+שימוש:
+    pdf_download(report, file_prefix="ניתוח_שוק")
+"""
+from __future__ import annotations
+
+import logging
+
+import streamlit as st
+
+from src.market.pdf_report import generate_pdf
+
+logger = logging.getLogger("realestate")
+
+
+def report_key(report) -> tuple:
+    """מזהה יציב לדוח עבור המטמונים שמקבלים את הדוח עצמו כארגומנט לא-מגובב."""
+    return (report.subject_address, report.report_date.isoformat())
+
+
+@st.cache_data(show_spinner="⏳ בונה PDF...", max_entries=16)
+def _build_pdf(key: tuple, _report) -> bytes:
+    """ה-PDF נבנה רק לפי בקשה, ופעם אחת לכל דוח (key מזהה אותו)."""
+    return generate_pdf(_report).getvalue()
+
+
+@st.fragment
+def pdf_download(report, file_prefix: str) -> None:
+    """כפתור "הכן" מפיק את ה-PDF; מאותו רגע הדוח מוצע להורדה בכל rerun."""
+    key = report_key(report)
+    if st.session_state.get("pdf_for") != key:
+        if not st.button("📄  הכן דו\"ח PDF", use_container_width=True):
+            return
+        st.session_state["pdf_for"] = key
+
+    try:
+        pdf_bytes = _build_pdf(key, report)
+    except Exception:
+        logger.exception(f"PDF generation failed for {report.subject_address}")
+        st.caption("לא ניתן להפיק PDF לדוח זה")
+        return
+
+    safe_addr = report.subject_address.replace(" ", "_").replace(",", "")
+    st.download_button(
+        label="📄  הורד דו\"ח PDF",
+        data=pdf_bytes,
+        file_name=f"{file_prefix}_{safe_addr}.pdf",
+        mime="application/pdf",
+        use_container_width=True,
+    )